@@ -136,6 +136,10 @@ __Settings__:
 
  - Positions: We update the positions and positions threshold using the previous model-fitting result (as described 
  in `chaining/examples/parametric_to_inversion.py`) to remove unphysical solutions from the `Inversion` model-fitting.
+
+ - Inversion: We use the w_tilde formalism of the `Inversion` linear algebra, which precomputes the convolution of 
+ every pair of noise-map values with the PSF once, as opposed to blurring the mapping matrix every iteration of the 
+ log likelihood function. This is only possible because hyper-galaxies, which scale the noise-map, are not used.
 """
 settings_lens = al.SettingsLens(
     positions_threshold=source_parametric_results.last.positions_threshold_from(
@@ -147,6 +151,7 @@ analysis = al.AnalysisImaging(
     dataset=imaging,
     positions=source_parametric_results.last.image_plane_multiple_image_positions,
     settings_lens=settings_lens,
+    settings_inversion=al.SettingsInversion(use_w_tilde=True),
 )
 
 source_inversion_results = slam.source_inversion.no_lens_light(
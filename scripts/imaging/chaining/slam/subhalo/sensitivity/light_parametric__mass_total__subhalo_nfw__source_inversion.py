@@ -148,6 +148,9 @@ __Settings__:
 
  - Positions: We update the positions and positions threshold using the previous model-fitting result (as described 
  in `chaining/examples/parametric_to_inversion.py`) to remove unphysical solutions from the `Inversion` model-fitting.
+
+ - Inversion: We use the w_tilde formalism of the `Inversion` linear algebra to speed up the log likelihood function 
+ (see `chaining/slam/mass_total__source_inversion.py`), which is possible because hyper-galaxies are not used.
 """
 settings_lens = al.SettingsLens(
     positions_threshold=source_parametric_results.last.positions_threshold_from(
@@ -159,6 +162,7 @@ analysis = al.AnalysisImaging(
     dataset=imaging,
     positions=source_parametric_results.last.image_plane_multiple_image_positions,
     settings_lens=settings_lens,
+    settings_inversion=al.SettingsInversion(use_w_tilde=True),
 )
 
 source_inversion_results = slam.source_inversion.with_lens_light(
@@ -40,7 +40,10 @@ dataset_path = path.join("dataset", dataset_type, dataset_name)
 __Ray Tracing__
 
 Setup the lens galaxy's mass (SIE) and source galaxy `PointSource` for this simulated lens. We include a 
-faint dist in the source for purely visualization purposes to show where the multiple images appear.
+faint disk in the source for purely visualization purposes to show where the multiple images appear.
+
+The `PositionsSolver` and magnification calculations below only use the lens mass and the `PointSource` centre,
+therefore the source's `EllExponential` is only evaluated when the image of the tracer is plotted and output.
 
 For lens modeling, defining ellipticity in terms of the `elliptical_comps` improves the model-fitting procedure.
 
@@ -94,42 +97,44 @@ positions = solver.solve(
     lensing_obj=tracer, source_plane_coordinate=source_galaxy.point_0.centre
 )
 
-positions = al.Grid2DIrregular(
-    grid=[
-        positions.in_list[2],
-        positions.in_list[9],
-        positions.in_list[-3],
-        positions.in_list[-1],
-    ]
-)
+positions = al.Grid2DIrregular(grid=np.asarray(positions)[[2, 9, -3, -1]])
 
 """
 Use the positions to compute the magnification of the `Tracer` at every position.
+
+The magnification is computed via finite differences of the deflection angles, which use a `buffer` smaller than the
+default so that they remain accurate for images near a critical curve, where the magnification is largest.
 """
-magnifications = tracer.magnification_via_hessian_from_grid(grid=positions)
+magnifications = tracer.magnification_via_hessian_from_grid(
+    grid=positions, buffer=0.001
+)
 
 """
 We can now compute the observed fluxes of the `PointSource`, give we know how much each is magnified.
 """
 flux = 1.0
-fluxes = [flux * np.abs(magnification) for magnification in magnifications]
-fluxes = al.ValuesIrregular(values=fluxes)
+fluxes = al.ValuesIrregular(values=flux * np.abs(magnifications))
 
 """
 We now output the image of this strong lens to `.fits` which can be used for visualize when performing point-source 
 modeling and to `.png` for general inspection.
+
+The image of the tracer is computed once and used for both the figure displayed below and the `.fits` output. The 
+figure uses the `TracerPlotter`'s visuals, so it still shows the critical curves and centres turned on in
+`config/visualize/include.ini`.
 """
+image = tracer.image_2d_from_grid(grid=grid)
+
 visuals_2d = aplt.Visuals2D(multiple_images=positions)
 
 tracer_plotter = aplt.TracerPlotter(tracer=tracer, grid=grid, visuals_2d=visuals_2d)
-tracer_plotter.figures_2d(image=True)
 
-mat_plot_2d = aplt.MatPlot2D(
-    output=aplt.Output(path=dataset_path, filename="image_2d", format="fits")
+array_plotter = aplt.Array2DPlotter(
+    array=image, visuals_2d=tracer_plotter.visuals_with_include_2d
 )
+array_plotter.figure_2d()
 
-tracer_plotter = aplt.TracerPlotter(tracer=tracer, grid=grid, mat_plot_2d=mat_plot_2d)
-tracer_plotter.figures_2d(image=True)
+image.output_to_fits(file_path=path.join(dataset_path, "image_2d.fits"), overwrite=True)
 
 mat_plot_2d = aplt.MatPlot2D(output=aplt.Output(path=dataset_path, format="png"))
 
@@ -145,7 +150,7 @@ point_source_dataset = al.PointSourceDataset(
     positions=positions,
     positions_noise_map=positions.values_from_value(value=grid.pixel_scale),
     fluxes=fluxes,
-    fluxes_noise_map=al.ValuesIrregular(values=[1.0, 1.0, 1.0, 1.0]),
+    fluxes_noise_map=al.ValuesIrregular(values=np.ones(len(fluxes))),
 )
 
 point_source_dict = al.PointSourceDict(point_source_dataset_list=[point_source_dataset])
@@ -1,3 +1,15 @@
+"""
+The Source, Light and Mass (SLaM) pipelines.
+
+__Parallelization__
+
+The `number_of_cores` input of each pipeline distributes the likelihood evaluations of its non-linear searches over
+multiple processes using the Python multiprocessing module. When it is above 1, the environment variables
+`OMP_NUM_THREADS` and `MKL_NUM_THREADS` should be set to 1 before Python is launched. This stops the linear algebra
+of every process from also using multiple threads, which would oversubscribe the cores. The variables cannot be set
+by the pipelines themselves, because NumPy fixes its thread pools when it is first imported.
+"""
+
 from . import source_parametric
 from . import source_inversion
 from . import light_parametric
@@ -48,6 +48,13 @@ def hyper_fit(
         include_hyper_image_sky=include_hyper_image_sky,
     )
 
+    """
+    If the `setup_hyper` has no active hyper components (and the model has no `Pixelization`) there is no hyper model
+    to fit, in which case the `Result` is returned before the `analysis` (and its dataset) is copied below.
+    """
+    if hyper_model is None:
+        return result
+
     return al.util.model.hyper_fit(
         hyper_model=hyper_model,
         setup_hyper=setup_hyper,
@@ -79,28 +79,39 @@ def with_lens_light(
     of the SOURCE PIPELINE and LIGHT PIPELINE.
 
     The `mass_to_light_ratio` prior of each light and stellar profile is set using the Einstein Mass estimate of the
-    SOURCE PIPELINE, specifically using values which are 1% and 500% this estimate.
+    SOURCE PIPELINE, specifically using values which are 1% and 500% this estimate. This estimate is computed once
+    and used for every light and stellar profile.
 
     The dark matter mass profile has the lens and source redshifts added to it, which are used to determine its mass
     from the mass-to-concentration relation of Ludlow et al.    
     """
+    einstein_radius_and_mass = None
+
+    if einstein_mass_range is not None:
+        einstein_radius_and_mass = slam_util.einstein_radius_and_mass_from(
+            result=light_results.last
+        )
+
     lens_bulge = slam_util.pass_light_and_mass_profile_priors(
         model=lens_bulge,
         result_light_component=light_results.last.model.galaxies.lens.bulge,
         result=light_results.last,
         einstein_mass_range=einstein_mass_range,
+        einstein_radius_and_mass=einstein_radius_and_mass,
     )
     lens_disk = slam_util.pass_light_and_mass_profile_priors(
         model=lens_disk,
         result_light_component=light_results.last.model.galaxies.lens.disk,
         result=light_results.last,
         einstein_mass_range=einstein_mass_range,
+        einstein_radius_and_mass=einstein_radius_and_mass,
     )
     lens_envelope = slam_util.pass_light_and_mass_profile_priors(
         model=lens_envelope,
         result_light_component=light_results.last.model.galaxies.lens.envelope,
         result=light_results.last,
         einstein_mass_range=einstein_mass_range,
+        einstein_radius_and_mass=einstein_radius_and_mass,
     )
 
     dark.mass_at_200 = af.LogUniformPrior(lower_limit=1e10, upper_limit=1e15)
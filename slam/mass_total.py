@@ -15,6 +15,9 @@ def no_lens_light(
     smbh: af.Model(al.mp.MassProfile) = None,
     mass_centre: Optional[Tuple[float, float]] = None,
     end_with_hyper_extension: bool = False,
+    number_of_cores: int = 1,
+    search_cls: Optional[af.NonLinearSearch] = None,
+    search_dict: Optional[dict] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -41,6 +44,16 @@ def no_lens_light(
     end_with_hyper_extension
         If `True` a hyper extension is performed at the end of the pipeline. If this feature is used, you must be
         certain you have manually passed the new hyper images geneted in this search to the next pipelines.
+    number_of_cores
+        The number of cores used by the non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    search_cls
+        The non-linear search used to fit the lens model. By default this is `DynestyStatic`, but a search like
+        `DynestyDynamic` can be used instead.
+    search_dict
+        The dictionary of search options for the non-linear search, which by default uses 100 live points. The default
+        options are only used if `search_cls` is not input, otherwise the search uses the settings in its config file.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -58,8 +71,10 @@ def no_lens_light(
     This search aims to accurately estimate the lens mass model, using the improved mass model priors and source model 
     of the SOURCE PIPELINE
     """
+    source_result = source_results.last
+
     mass = slam_util.mass__from_result(
-        mass=mass, result=source_results.last, unfix_mass_centre=True
+        mass=mass, result=source_result, unfix_mass_centre=True
     )
 
     if mass_centre is not None:
@@ -69,28 +84,36 @@ def no_lens_light(
         smbh.centre = mass.centre
 
     source = slam_util.source__from_result_model_if_parametric(
-        result=source_results.last, setup_hyper=setup_hyper
+        result=source_result, setup_hyper=setup_hyper
     )
 
     model = af.Collection(
         galaxies=af.Collection(
             lens=af.Model(
                 al.Galaxy,
-                redshift=source_results.last.instance.galaxies.lens.redshift,
+                redshift=source_result.instance.galaxies.lens.redshift,
                 mass=mass,
                 smbh=smbh,
-                shear=source_results.last.model.galaxies.lens.shear,
+                shear=source_result.model.galaxies.lens.shear,
             ),
             source=source,
         )
     )
 
-    search = af.DynestyStatic(
+    search_cls, search_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_cls,
+        search_dict=search_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 100},
+    )
+
+    search = search_cls(
         path_prefix=path_prefix,
         name="mass_total[1]_mass[total]_source",
         unique_tag=unique_tag,
         session=session,
-        nlive=100,
+        number_of_cores=number_of_cores,
+        **search_dict,
     )
 
     result_1 = search.fit(model=model, analysis=analysis)
@@ -128,6 +151,9 @@ def with_lens_light(
     smbh: af.Model(al.mp.MassProfile) = None,
     mass_centre: Optional[Tuple[float, float]] = None,
     end_with_hyper_extension: bool = False,
+    number_of_cores: int = 1,
+    search_cls: Optional[af.NonLinearSearch] = None,
+    search_dict: Optional[dict] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -156,6 +182,16 @@ def with_lens_light(
     end_with_hyper_extension
         If `True` a hyper extension is performed at the end of the pipeline. If this feature is used, you must be
         certain you have manually passed the new hyper images geneted in this search to the next pipelines.
+    number_of_cores
+        The number of cores used by the non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    search_cls
+        The non-linear search used to fit the lens model. By default this is `DynestyStatic`, but a search like
+        `DynestyDynamic` can be used instead.
+    search_dict
+        The dictionary of search options for the non-linear search, which by default uses 100 live points. The default
+        options are only used if `search_cls` is not input, otherwise the search uses the settings in its config file.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -173,8 +209,10 @@ def with_lens_light(
     This search aims to accurately estimate the lens mass model, using the improved mass model priors and source model 
     of the SOURCE PIPELINE
     """
+    source_result = source_results.last
+
     mass = slam_util.mass__from_result(
-        mass=mass, result=source_results.last, unfix_mass_centre=True
+        mass=mass, result=source_result, unfix_mass_centre=True
     )
 
     if mass_centre is not None:
@@ -184,34 +222,45 @@ def with_lens_light(
         smbh.centre = mass.centre
 
     source = slam_util.source__from_result_model_if_parametric(
-        result=source_results.last, setup_hyper=setup_hyper
+        result=source_result, setup_hyper=setup_hyper
     )
 
+    light_result = light_results.last
+    light_lens = light_result.instance.galaxies.lens
+
     model = af.Collection(
         galaxies=af.Collection(
             lens=af.Model(
                 al.Galaxy,
-                redshift=light_results.last.instance.galaxies.lens.redshift,
-                bulge=light_results.last.instance.galaxies.lens.bulge,
-                disk=light_results.last.instance.galaxies.lens.disk,
-                envelope=light_results.last.instance.galaxies.lens.envelope,
+                redshift=light_lens.redshift,
+                bulge=light_lens.bulge,
+                disk=light_lens.disk,
+                envelope=light_lens.envelope,
                 mass=mass,
-                shear=source_results.last.model.galaxies.lens.shear,
+                shear=source_result.model.galaxies.lens.shear,
                 smbh=smbh,
                 hyper_galaxy=setup_hyper.hyper_galaxy_lens_from_result(
-                    result=light_results.last
+                    result=light_result
                 ),
             ),
             source=source,
         )
     )
 
-    search = af.DynestyStatic(
+    search_cls, search_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_cls,
+        search_dict=search_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 100},
+    )
+
+    search = search_cls(
         path_prefix=path_prefix,
         name="mass_total[1]_light[parametric]_mass[total]_source",
         unique_tag=unique_tag,
         session=session,
-        nlive=100,
+        number_of_cores=number_of_cores,
+        **search_dict,
     )
 
     result_1 = search.fit(model=model, analysis=analysis)
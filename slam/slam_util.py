@@ -15,14 +15,9 @@ def set_lens_light_centres(lens, light_centre: Tuple[float, float]):
        If input, the centre of every light model centre is set using this (y,x) value.
     """
 
-    if lens.bulge is not None:
-        lens.bulge.centre = light_centre
-
-    if lens.disk is not None:
-        lens.disk.centre = light_centre
-
-    if lens.envelope is not None:
-        lens.envelope.centre = light_centre
+    for light in (lens.bulge, lens.disk, lens.envelope):
+        if light is not None:
+            light.centre = light_centre
 
 
 def set_lens_light_model_centre_priors(
@@ -46,17 +41,14 @@ def set_lens_light_model_centre_priors(
     mean = light_centre_gaussian_prior_values[0]
     sigma = light_centre_gaussian_prior_values[1]
 
-    if lens.bulge is not None:
-        lens.bulge.centre_0 = af.GaussianPrior(mean=mean, sigma=sigma)
-        lens.bulge.centre_1 = af.GaussianPrior(mean=mean, sigma=sigma)
-
-    if lens.disk is not None:
-        lens.disk.centre_0 = af.GaussianPrior(mean=mean, sigma=sigma)
-        lens.disk.centre_1 = af.GaussianPrior(mean=mean, sigma=sigma)
-
-    if lens.envelope is not None:
-        lens.envelope.centre_0 = af.GaussianPrior(mean=mean, sigma=sigma)
-        lens.envelope.centre_1 = af.GaussianPrior(mean=mean, sigma=sigma)
+    """
+    Every centre is given its own `GaussianPrior`, as sharing one prior would make the centres of all light profiles
+    the same free parameter.
+    """
+    for light in (lens.bulge, lens.disk, lens.envelope):
+        if light is not None:
+            light.centre_0 = af.GaussianPrior(mean=mean, sigma=sigma)
+            light.centre_1 = af.GaussianPrior(mean=mean, sigma=sigma)
 
 
 def pass_light_and_mass_profile_priors(
@@ -65,6 +57,7 @@ def pass_light_and_mass_profile_priors(
     result: af.Result,
     einstein_mass_range: Optional[Tuple[float, float]] = None,
     as_instance: bool = False,
+    einstein_radius_and_mass: Optional[Tuple[float, float]] = None,
 ) -> Optional[af.Model]:
     """
     Returns an updated version of a `LightMassProfile` model (e.g. a bulge or disk) whose priors are initialized from
@@ -91,6 +84,10 @@ def pass_light_and_mass_profile_priors(
         upper limits of the profile's mass-to-light ratio.
     as_instance : bool
         If `True` the prior is set up as an instance, else it is set up as a model component.
+    einstein_radius_and_mass
+        The Einstein radius and Einstein mass of the result's maximum log likelihood tracer. If they have already
+        been computed for this result (e.g. for the bulge) they can be input to avoid computing them again,
+        otherwise they are computed from the result.
 
     Returns
     -------
@@ -106,7 +103,10 @@ def pass_light_and_mass_profile_priors(
     if einstein_mass_range is not None:
 
         model = update_mass_to_light_ratio_prior(
-            model=model, result=result, einstein_mass_range=einstein_mass_range
+            model=model,
+            result=result,
+            einstein_mass_range=einstein_mass_range,
+            einstein_radius_and_mass=einstein_radius_and_mass,
         )
 
     return model
@@ -116,7 +116,8 @@ def update_mass_to_light_ratio_prior(
     model: af.Model(al.lmp.LightMassProfile),
     result: af.Result,
     einstein_mass_range: Tuple[float, float],
-    bins: int = 100,
+    bins: int = 16,
+    einstein_radius_and_mass: Optional[Tuple[float, float]] = None,
 ) -> Optional[af.Model]:
     """
     Updates the mass to light ratio parameter of a `LightMassProfile` model (e.g. a bulge or disk) such that the
@@ -136,7 +137,12 @@ def update_mass_to_light_ratio_prior(
         The values a the estimate of the Einstein Mass in the LIGHT PIPELINE is multiplied by to set the lower and upper
         limits of the profile's mass-to-light ratio.
     bins
-        The number of bins used to map a calculated Einstein Mass to that of the `LightMassProfile`.
+        The number of bins used to map a calculated Einstein Mass to that of the `LightMassProfile`. The bins only
+        bracket the normalization, which is then solved for via root-finding, therefore the precision of the
+        mass-to-light ratio does not depend on the number of bins.
+    einstein_radius_and_mass
+        The Einstein radius and Einstein mass of the result's maximum log likelihood tracer. If `None` they are
+        computed from the result.
 
     Returns
     -------
@@ -147,15 +153,10 @@ def update_mass_to_light_ratio_prior(
     if model is None:
         return None
 
-    grid = result.max_log_likelihood_fit.grid
-
-    einstein_radius = result.max_log_likelihood_tracer.einstein_radius_from_grid(
-        grid=grid
-    )
+    if einstein_radius_and_mass is None:
+        einstein_radius_and_mass = einstein_radius_and_mass_from(result=result)
 
-    einstein_mass = result.max_log_likelihood_tracer.einstein_mass_angular_from_grid(
-        grid=grid
-    )
+    einstein_radius, einstein_mass = einstein_radius_and_mass
 
     einstein_mass_lower = einstein_mass_range[0] * einstein_mass
     einstein_mass_upper = einstein_mass_range[1] * einstein_mass
@@ -165,8 +166,14 @@ def update_mass_to_light_ratio_prior(
     mass_to_light_ratio_lower = instance.normalization_from_mass_angular_and_radius(
         mass_angular=einstein_mass_lower, radius=einstein_radius, bins=bins
     )
-    mass_to_light_ratio_upper = instance.normalization_from_mass_angular_and_radius(
-        mass_angular=einstein_mass_upper, radius=einstein_radius, bins=bins
+
+    """
+    The mass of a `LightMassProfile` within a circle is proportional to its mass-to-light ratio, therefore the upper 
+    limit is the lower limit scaled by the ratio of the two Einstein masses, which avoids a second root-finding of the
+    normalization over all `bins`.
+    """
+    mass_to_light_ratio_upper = mass_to_light_ratio_lower * (
+        einstein_mass_upper / einstein_mass_lower
     )
 
     model.mass_to_light_ratio = af.LogUniformPrior(
@@ -176,6 +183,39 @@ def update_mass_to_light_ratio_prior(
     return model
 
 
+def einstein_radius_and_mass_from(result: af.Result) -> Tuple[float, float]:
+    """
+    Returns the Einstein radius and Einstein mass of the maximum log likelihood tracer of a result, which are used to
+    set the mass-to-light ratio priors of `LightMassProfile`'s.
+
+    Computing the Einstein radius requires the tangential critical curve of the tracer, which is expensive. A pipeline
+    which updates the mass-to-light ratio prior of multiple components (e.g. a bulge, disk and envelope) from the
+    same result should therefore compute these values once and pass them to each component.
+
+    Parameters
+    ----------
+    result
+        The result of the LIGHT PIPELINE whose maximum log likelihood tracer is used to compute the Einstein radius
+        and Einstein mass.
+
+    Returns
+    -------
+    (float, float)
+        The Einstein radius and Einstein mass of the result's maximum log likelihood tracer.
+    """
+    grid = result.max_log_likelihood_fit.grid
+
+    einstein_radius = result.max_log_likelihood_tracer.einstein_radius_from_grid(
+        grid=grid
+    )
+
+    einstein_mass = result.max_log_likelihood_tracer.einstein_mass_angular_from_grid(
+        grid=grid
+    )
+
+    return einstein_radius, einstein_mass
+
+
 def mass__from_result(
     mass, result: af.Result, unfix_mass_centre: bool = False
 ) -> af.Model:
@@ -204,14 +244,15 @@ def mass__from_result(
 
     mass.take_attributes(source=result.model.galaxies.lens.mass)
 
-    if unfix_mass_centre and isinstance(mass.centre, tuple):
+    centre_tuple = mass.centre
 
-        centre_tuple = mass.centre
+    if unfix_mass_centre and isinstance(centre_tuple, tuple):
 
-        mass.centre = af.Model(mass.cls).centre
+        centre = af.TuplePrior()
+        centre.centre_0 = af.GaussianPrior(mean=centre_tuple[0], sigma=0.05)
+        centre.centre_1 = af.GaussianPrior(mean=centre_tuple[1], sigma=0.05)
 
-        mass.centre.centre_0 = af.GaussianPrior(mean=centre_tuple[0], sigma=0.05)
-        mass.centre.centre_1 = af.GaussianPrior(mean=centre_tuple[1], sigma=0.05)
+        mass.centre = centre
 
     return mass
 
@@ -243,73 +284,41 @@ def source__from_result(
 
     hyper_galaxy = setup_hyper.hyper_galaxy_source_from_result(result=result)
 
-    if result.instance.galaxies.source.pixelization is None:
+    source_instance = result.instance.galaxies.source
+
+    if source_instance.pixelization is None:
+
+        source = result.model.galaxies.source if source_is_model else source_instance
+
+        return af.Model(
+            al.Galaxy,
+            redshift=source_instance.redshift,
+            bulge=source.bulge,
+            disk=source.disk,
+            envelope=source.envelope,
+            hyper_galaxy=hyper_galaxy,
+        )
 
-        if source_is_model:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                bulge=result.model.galaxies.source.bulge,
-                disk=result.model.galaxies.source.disk,
-                envelope=result.model.galaxies.source.envelope,
-                hyper_galaxy=hyper_galaxy,
-            )
-
-        else:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                bulge=result.instance.galaxies.source.bulge,
-                disk=result.instance.galaxies.source.disk,
-                envelope=result.instance.galaxies.source.envelope,
-                hyper_galaxy=hyper_galaxy,
-            )
-
-    if hasattr(result, "hyper"):
-
-        if source_is_model:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                pixelization=result.hyper.instance.galaxies.source.pixelization,
-                regularization=result.hyper.model.galaxies.source.regularization,
-                hyper_galaxy=hyper_galaxy,
-            )
-
-        else:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                pixelization=result.hyper.instance.galaxies.source.pixelization,
-                regularization=result.hyper.instance.galaxies.source.regularization,
-                hyper_galaxy=hyper_galaxy,
-            )
-
-    else:
-
-        if source_is_model:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                pixelization=result.instance.galaxies.source.pixelization,
-                regularization=result.model.galaxies.source.regularization,
-                hyper_galaxy=hyper_galaxy,
-            )
-
-        else:
-
-            return af.Model(
-                al.Galaxy,
-                redshift=result.instance.galaxies.source.redshift,
-                pixelization=result.instance.galaxies.source.pixelization,
-                regularization=result.instance.galaxies.source.regularization,
-                hyper_galaxy=hyper_galaxy,
-            )
+    """
+    The inversion is taken from the hyper result if a hyper extension was performed, where the pixelization is always 
+    an instance and the regularization is a model or instance depending on `source_is_model`.
+    """
+    inversion_result = result.hyper if hasattr(result, "hyper") else result
+
+    inversion_instance = inversion_result.instance.galaxies.source
+    inversion = (
+        inversion_result.model.galaxies.source
+        if source_is_model
+        else inversion_instance
+    )
+
+    return af.Model(
+        al.Galaxy,
+        redshift=source_instance.redshift,
+        pixelization=inversion_instance.pixelization,
+        regularization=inversion.regularization,
+        hyper_galaxy=hyper_galaxy,
+    )
 
 
 def source__from_result_model_if_parametric(
@@ -340,3 +349,38 @@ def source__from_result_model_if_parametric(
     return source__from_result(
         result=result, setup_hyper=setup_hyper, source_is_model=False
     )
+
+
+def search_cls_and_dict_from(
+    search_cls: Optional[af.NonLinearSearch],
+    search_dict: Optional[dict],
+    default_search_cls: af.NonLinearSearch,
+    default_search_dict: dict,
+) -> Tuple[af.NonLinearSearch, dict]:
+    """
+    Returns the non-linear search and dictionary of search options used by a search of a SLaM pipeline.
+
+    The default search options are specific to the default non-linear search (e.g. `nlive` and `walks` for
+    `DynestyStatic`), therefore they are only used if a `search_cls` is not input. If a `search_cls` is input without
+    a `search_dict`, the search uses the settings in its config file.
+
+    Parameters
+    ----------
+    search_cls
+        The non-linear search input into the pipeline, or `None` to use the default search.
+    search_dict
+        The dictionary of search options input into the pipeline, or `None` to use the default search options.
+    default_search_cls
+        The non-linear search used by the pipeline if a `search_cls` is not input.
+    default_search_dict
+        The dictionary of search options used if neither a `search_cls` nor a `search_dict` is input.
+
+    Returns
+    -------
+    (af.NonLinearSearch, dict)
+        The non-linear search and the dictionary of search options it is created with.
+    """
+    if search_cls is None:
+        return default_search_cls, search_dict or default_search_dict
+
+    return search_cls, search_dict or {}
@@ -15,6 +15,12 @@ def no_lens_light(
         al.pix.VoronoiBrightnessImage
     ),
     regularization: af.Model(al.reg.Regularization) = af.Model(al.reg.Constant),
+    number_of_cores: int = 1,
+    search_1_dict: Optional[dict] = None,
+    search_3_cls: Optional[af.NonLinearSearch] = None,
+    search_3_dict: Optional[dict] = None,
+    search_4_cls: Optional[af.NonLinearSearch] = None,
+    search_4_dict: Optional[dict] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -35,6 +41,28 @@ def no_lens_light(
         The pixelization used by the `Inversion` which fits the source light.
     regularization
         The regularization used by the `Inversion` which fits the source light.
+    number_of_cores
+        The number of cores used by every non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    search_1_dict
+        The dictionary of search options for the `DynestyStatic` search 1, which only fits the 3 parameters of the
+        `VoronoiMagnification` pixelization and `Constant` regularization and by default therefore uses 15 live points.
+    search_3_cls
+        The non-linear search used by search 3, which fits the source using the adaptive pixelization. By default
+        this is `DynestyStatic`, but a search like `UltraNest` can be used instead.
+    search_3_dict
+        The dictionary of search options for search 3, which by default are the `DynestyStatic` settings. Only the
+        maximum likelihood model of search 3 is used (to initialize search 4), therefore by default it uses 20 live
+        points and a `dlogz` of at least 1.0. The default options are only used if `search_3_cls` is not input,
+        otherwise the search uses the settings in its config file.
+    search_4_cls
+        The non-linear search used by search 4, which fits the lens mass using the adaptive pixelization and is the
+        most expensive search of the pipeline. By default this is `DynestyStatic`, but a search like `DynestyDynamic`
+        can be used instead.
+    search_4_dict
+        The dictionary of search options for search 4, which by default are the `DynestyStatic` settings. The default
+        options are only used if `search_4_cls` is not input, otherwise the search uses the settings in its config file.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -77,12 +105,15 @@ def no_lens_light(
         ),
     )
 
+    search_1_dict = search_1_dict or {"nlive": 15}
+
     search = af.DynestyStatic(
         path_prefix=path_prefix,
         name="source_inversion[1]_mass[fixed]_source[inversion_magnification_initialization]",
         unique_tag=unique_tag,
         session=session,
-        nlive=30,
+        number_of_cores=number_of_cores,
+        **search_1_dict,
     )
 
     result_1 = search.fit(model=model, analysis=analysis.no_positions)
@@ -119,12 +150,21 @@ def no_lens_light(
         hyper_background_noise=result_1.instance.hyper_background_noise,
     )
 
+    """
+    The `VoronoiMagnification` pixelization is fixed to the result of search 1 and its image-plane grid does not 
+    depend on the lens mass model, therefore it is preloaded for every iteration of search 2.
+    """
+    analysis.preloads = al.Preloads.setup(
+        result=result_1, model=model, pixelization=True
+    )
+
     search = af.DynestyStatic(
         path_prefix=path_prefix,
         name="source_inversion[2]_mass[total]_source[fixed]",
         unique_tag=unique_tag,
         session=session,
         nlive=50,
+        number_of_cores=number_of_cores,
     )
 
     result_2 = search.fit(model=model, analysis=analysis)
@@ -160,14 +200,29 @@ def no_lens_light(
         hyper_background_noise=result_2.instance.hyper_background_noise,
     )
 
-    search = af.DynestyStatic(
+    """
+    The pixelization is a free parameter of search 3, therefore the pixelization preloaded for search 2 is removed.
+    """
+    analysis.preloads = al.Preloads()
+
+    search_3_cls, search_3_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_3_cls,
+        search_dict=search_3_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={
+            "nlive": 20,
+            "dlogz": max(setup_hyper.dlogz, 1.0),
+            "sample": "rstagger",
+        },
+    )
+
+    search = search_3_cls(
         path_prefix=path_prefix,
         name="source_inversion[3]_mass[fixed]_source[inversion_initialization]",
         unique_tag=unique_tag,
         session=session,
-        nlive=30,
-        dlogz=setup_hyper.dlogz,
-        sample="rstagger",
+        number_of_cores=number_of_cores,
+        **search_3_dict,
     )
 
     analysis.set_hyper_dataset(result=result_2)
@@ -217,12 +272,20 @@ def no_lens_light(
         result=result_3, model=model, pixelization=True
     )
 
-    search = af.DynestyStatic(
+    search_4_cls, search_4_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_4_cls,
+        search_dict=search_4_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 50},
+    )
+
+    search = search_4_cls(
         path_prefix=path_prefix,
         name="source_inversion[4]_mass[total]_source[fixed]",
         unique_tag=unique_tag,
         session=session,
-        nlive=50,
+        number_of_cores=number_of_cores,
+        **search_4_dict,
     )
 
     result_4 = search.fit(model=model, analysis=analysis)
@@ -256,6 +319,12 @@ def with_lens_light(
         al.pix.VoronoiBrightnessImage
     ),
     regularization: af.Model(al.reg.Regularization) = af.Model(al.reg.Constant),
+    number_of_cores: int = 1,
+    search_1_dict: Optional[dict] = None,
+    search_3_cls: Optional[af.NonLinearSearch] = None,
+    search_3_dict: Optional[dict] = None,
+    search_4_cls: Optional[af.NonLinearSearch] = None,
+    search_4_dict: Optional[dict] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -276,6 +345,28 @@ def with_lens_light(
         The pixelization used by the `Inversion` which fits the source light.
     regularization
         The regularization used by the `Inversion` which fits the source light.
+    number_of_cores
+        The number of cores used by every non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    search_1_dict
+        The dictionary of search options for the `DynestyStatic` search 1, which only fits the 3 parameters of the
+        `VoronoiMagnification` pixelization and `Constant` regularization and by default therefore uses 15 live points.
+    search_3_cls
+        The non-linear search used by search 3, which fits the source using the adaptive pixelization. By default
+        this is `DynestyStatic`, but a search like `UltraNest` can be used instead.
+    search_3_dict
+        The dictionary of search options for search 3, which by default are the `DynestyStatic` settings. Only the
+        maximum likelihood model of search 3 is used (to initialize search 4), therefore by default it uses 20 live
+        points and a `dlogz` of at least 1.0. The default options are only used if `search_3_cls` is not input,
+        otherwise the search uses the settings in its config file.
+    search_4_cls
+        The non-linear search used by search 4, which fits the lens mass using the adaptive pixelization and is the
+        most expensive search of the pipeline. By default this is `DynestyStatic`, but a search like `DynestyDynamic`
+        can be used instead.
+    search_4_dict
+        The dictionary of search options for search 4, which by default are the `DynestyStatic` settings. The default
+        options are only used if `search_4_cls` is not input, otherwise the search uses the settings in its config file.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -326,12 +417,15 @@ def with_lens_light(
         ),
     )
 
+    search_1_dict = search_1_dict or {"nlive": 15}
+
     search = af.DynestyStatic(
         path_prefix=path_prefix,
         name="source_inversion[1]_light[fixed]_mass[fixed]_source[inversion_magnification_initialization]",
         unique_tag=unique_tag,
         session=session,
-        nlive=30,
+        number_of_cores=number_of_cores,
+        **search_1_dict,
     )
 
     result_1 = search.fit(model=model, analysis=analysis.no_positions)
@@ -374,12 +468,21 @@ def with_lens_light(
         hyper_background_noise=result_1.instance.hyper_background_noise,
     )
 
+    """
+    The `VoronoiMagnification` pixelization is fixed to the result of search 1 and its image-plane grid does not 
+    depend on the lens mass model, therefore it is preloaded for every iteration of search 2.
+    """
+    analysis.preloads = al.Preloads.setup(
+        result=result_1, model=model, pixelization=True
+    )
+
     search = af.DynestyStatic(
         path_prefix=path_prefix,
         name="source_inversion[2]_light[fixed]_mass[total]_source[inversion_magnification]",
         unique_tag=unique_tag,
         session=session,
         nlive=50,
+        number_of_cores=number_of_cores,
     )
 
     result_2 = search.fit(model=model, analysis=analysis)
@@ -421,14 +524,29 @@ def with_lens_light(
         hyper_background_noise=result_2.instance.hyper_background_noise,
     )
 
-    search = af.DynestyStatic(
+    """
+    The pixelization is a free parameter of search 3, therefore the pixelization preloaded for search 2 is removed.
+    """
+    analysis.preloads = al.Preloads()
+
+    search_3_cls, search_3_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_3_cls,
+        search_dict=search_3_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={
+            "nlive": 20,
+            "dlogz": max(setup_hyper.dlogz, 1.0),
+            "sample": "rstagger",
+        },
+    )
+
+    search = search_3_cls(
         path_prefix=path_prefix,
         name="source_inversion[3]_light[fixed]_mass[fixed]_source[inversion_initialization]",
         unique_tag=unique_tag,
         session=session,
-        nlive=30,
-        dlogz=setup_hyper.dlogz,
-        sample="rstagger",
+        number_of_cores=number_of_cores,
+        **search_3_dict,
     )
 
     analysis.set_hyper_dataset(result=result_2)
@@ -484,12 +602,20 @@ def with_lens_light(
         result=result_3, model=model, pixelization=True
     )
 
-    search = af.DynestyStatic(
+    search_4_cls, search_4_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_4_cls,
+        search_dict=search_4_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 50},
+    )
+
+    search = search_4_cls(
         path_prefix=path_prefix,
         name="source_inversion[4]_light[fixed]_mass[total]_source[inversion]",
         unique_tag=unique_tag,
         session=session,
-        nlive=50,
+        number_of_cores=number_of_cores,
+        **search_4_dict,
     )
 
     result_4 = search.fit(model=model, analysis=analysis)
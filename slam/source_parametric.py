@@ -1,7 +1,9 @@
 import autofit as af
 import autolens as al
+from . import slam_util
 from . import extensions
 
+import copy
 from typing import Union, Optional, Tuple
 
 
@@ -17,6 +19,9 @@ def no_lens_light(
     redshift_lens: float = 0.5,
     redshift_source: float = 1.0,
     mass_centre: Optional[Tuple[float, float]] = None,
+    number_of_cores: int = 1,
+    search_cls: Optional[af.NonLinearSearch] = None,
+    search_dict: Optional[dict] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -53,6 +58,18 @@ def no_lens_light(
     mass_centre
         If input, a fixed (y,x) centre of the mass profile is used which is not treated as a free parameter by the
        non-linear search.
+    number_of_cores
+        The number of cores used by every non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    search_cls
+        The non-linear search used to fit the lens model. By default this is `DynestyStatic`, but a search like
+        `UltraNest` can be used instead.
+    search_dict
+        The dictionary of search options for the non-linear search. By default `DynestyStatic` uses 200 live points
+        and stops once the estimated remaining evidence `dlogz` is below 0.5, as this search only initializes the
+        priors of the searches that follow and does not need to converge to a precise posterior. The default options
+        are only used if `search_cls` is not input, otherwise the search uses the settings in its config file.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -68,7 +85,12 @@ def no_lens_light(
 
     This search aims to accurately estimate the lens mass model and source model.
     """
+    """
+    The default `mass` model is created once when the pipeline is defined and shared by every call, therefore it is 
+    copied before its centre is fixed so that the fixed centre does not persist into later calls.
+    """
     if mass_centre is not None:
+        mass = copy.deepcopy(mass)
         mass.centre = mass_centre
 
     model = af.Collection(
@@ -84,13 +106,20 @@ def no_lens_light(
         )
     )
 
-    search = af.DynestyStatic(
+    search_cls, search_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_cls,
+        search_dict=search_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 200, "walks": 10, "dlogz": 0.5},
+    )
+
+    search = search_cls(
         path_prefix=path_prefix,
         name="source_parametric[1]_mass[total]_source[parametric]",
         unique_tag=unique_tag,
         session=session,
-        nlive=200,
-        walks=10,
+        number_of_cores=number_of_cores,
+        **search_dict,
     )
 
     result_1 = search.fit(model=model, analysis=analysis)
@@ -129,6 +158,11 @@ def with_lens_light(
     redshift_lens: float = 0.5,
     redshift_source: float = 1.0,
     mass_centre: Optional[Tuple[float, float]] = None,
+    number_of_cores: int = 1,
+    analysis_light: Optional[
+        Union[al.AnalysisImaging, al.AnalysisInterferometer]
+    ] = None,
+    lens_light_fixed: bool = True,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -175,6 +209,19 @@ def with_lens_light(
     mass_centre : (float, float)
        If input, a fixed (y,x) centre of the mass profile is used which is not treated as a free parameter by the
        non-linear search.
+    number_of_cores
+        The number of cores used by every non-linear search to evaluate the likelihood of live points. If 1, the
+        likelihood evaluations are performed in serial, if > 1 they are distributed in parallel using the Python
+        multiprocessing module (see the `slam` package docstring for the environment this requires).
+    analysis_light
+        If input, the analysis used by search 1, which only fits the lens light to provide a lens light subtracted
+        image for search 2 and therefore can use a cheaper likelihood function (e.g. a dataset with a lower
+        `sub_size` via `al.SettingsImaging`). If `None`, `analysis` is used.
+    lens_light_fixed
+        If `True`, the lens light is fixed to the maximum likelihood result of search 1 in search 2. If `False`, it
+        is fitted in search 2 with priors initialized from search 1, which adds dimensions to search 2 but lets it
+        compensate for small errors in the lens light subtraction of search 1. The lens light priors of search 3 are
+        then initialized from search 2.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -207,33 +254,50 @@ def with_lens_light(
         unique_tag=unique_tag,
         session=session,
         nlive=75,
+        number_of_cores=number_of_cores,
     )
 
-    result_1 = search.fit(model=model, analysis=analysis)
+    if analysis_light is None:
+        analysis_light = analysis
+
+    result_1 = search.fit(model=model, analysis=analysis_light)
 
     """
     __Model + Search + Analysis + Model-Fit (Search 2)__
 
     In search 2 of the SOURCE PARAMETRIC PIPELINE we fit a lens model where:
 
-     - The lens galaxy light is modeled using a parametric bulge + disk + envelope [fixed to result of Search 1].
+     - The lens galaxy light is modeled using a parametric bulge + disk + envelope [fixed to result of Search 1,
+     or priors initialized from search 1 if `lens_light_fixed=False`].
      - The lens galaxy mass is modeled using a total mass distribution [no prior initialization].
      - The source galaxy's light is a parametric bulge + disk + envelope [no prior initialization].
 
     This search aims to accurately estimate the lens mass model and source model.
     """
 
+    """
+    The default `mass` model is created once when the pipeline is defined and shared by every call, therefore it is 
+    copied before its centre is fixed so that the fixed centre does not persist into later calls.
+    """
     if mass_centre is not None:
+        mass = copy.deepcopy(mass)
         mass.centre = mass_centre
 
+    if lens_light_fixed:
+        lens_light = result_1.instance.galaxies.lens
+        lens_light_tag = "fixed"
+    else:
+        lens_light = result_1.model.galaxies.lens
+        lens_light_tag = "parametric"
+
     model = af.Collection(
         galaxies=af.Collection(
             lens=af.Model(
                 al.Galaxy,
                 redshift=redshift_lens,
-                bulge=result_1.instance.galaxies.lens.bulge,
-                disk=result_1.instance.galaxies.lens.disk,
-                envelope=result_1.instance.galaxies.lens.envelope,
+                bulge=lens_light.bulge,
+                disk=lens_light.disk,
+                envelope=lens_light.envelope,
                 mass=mass,
                 shear=shear,
             ),
@@ -249,11 +313,12 @@ def with_lens_light(
 
     search = af.DynestyStatic(
         path_prefix=path_prefix,
-        name="source_parametric[2]_light[fixed]_mass[total]_source[parametric]",
+        name=f"source_parametric[2]_light[{lens_light_tag}]_mass[total]_source[parametric]",
         unique_tag=unique_tag,
         session=session,
         nlive=200,
         walks=10,
+        number_of_cores=number_of_cores,
     )
 
     result_2 = search.fit(model=model, analysis=analysis)
@@ -264,12 +329,16 @@ def with_lens_light(
     In search 2 of the SOURCE PARAMETRIC PIPELINE we fit a lens model where:
 
      - The lens galaxy light is modeled using a parametric bulge + disk + envelope [priors are not initialized from 
-     previous searches].
+     previous searches, or priors initialized from search 2 if `lens_light_fixed=False`].
      - The lens galaxy mass is modeled using a total mass distribution [priors initialized from search 2].
      - The source galaxy's light is a parametric bulge + disk + envelope [priors initialized from search 2].
 
     This search aims to accurately estimate the lens light model, mass model and source model.
     """
+    if not lens_light_fixed:
+        lens_bulge = result_2.model.galaxies.lens.bulge
+        lens_disk = result_2.model.galaxies.lens.disk
+        lens_envelope = result_2.model.galaxies.lens.envelope
 
     model = af.Collection(
         galaxies=af.Collection(
@@ -298,6 +367,7 @@ def with_lens_light(
         unique_tag=unique_tag,
         session=session,
         nlive=100,
+        number_of_cores=number_of_cores,
     )
 
     result_3 = search.fit(model=model, analysis=analysis)
@@ -3,7 +3,8 @@ import autolens as al
 from autofit.non_linear.grid import sensitivity as s
 from . import slam_util
 
-from typing import Union, Tuple, ClassVar, Optional
+import copy
+from typing import Union, Tuple, ClassVar, List, Optional
 import numpy as np
 
 
@@ -14,8 +15,11 @@ def detection_single_plane(
     mass_results: af.ResultsCollection,
     subhalo_mass: af.Model(al.mp.MassProfile) = af.Model(al.mp.SphNFWMCRLudlow),
     grid_dimension_arcsec: float = 3.0,
-    number_of_steps: Union[Tuple[int], int] = 5,
+    number_of_steps: int = 5,
     number_of_cores: int = 1,
+    search_2_cls: Optional[af.NonLinearSearch] = None,
+    search_2_dict: Optional[dict] = None,
+    evidence_threshold: Optional[float] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -40,175 +44,46 @@ def detection_single_plane(
         all four directions extends to 3.0" giving it dimensions 6.0" x 6.0".
     number_of_steps
         The 2D dimensions of the grid (e.g. number_of_steps x number_of_steps) that the subhalo search is performed for.
+        The `SearchGridSearch` uses the same number of steps in the y and x directions, therefore this is an int.
     number_of_cores
         The number of cores used to perform the non-linear search grid search. If 1, each model-fit on the grid is
         performed in serial, if > 1 fits are distributed in parallel using the Python multiprocessing module.
+    search_2_cls
+        The non-linear search used by every model-fit of the search 2 grid search. By default this is
+        `DynestyStatic`, whose Bayesian evidences are compared to search 1 to determine if a subhalo is detected.
+        Another nested sampler like `UltraNest` can be used instead, which can be faster for the tightly bounded
+        priors of each grid cell. `DynestyDynamic` can also be used, but its additional live points target the
+        posterior and not the evidence.
+    search_2_dict
+        The dictionary of search options for every model-fit of the search 2 grid search, which by default are the
+        `DynestyStatic` settings. The default options are only used if `search_2_cls` is not input, otherwise the
+        search uses the settings in its config file.
+    evidence_threshold
+        If input, search 3 is only performed if the highest log evidence of the search 2 grid search exceeds the log
+        evidence of search 1 by this amount, such that the subhalo refinement is skipped for datasets where no subhalo
+        is detected. In this case the returned results only contain the results of search 1 and 2.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
     """
 
-    """
-    __Model + Search + Analysis + Model-Fit (Search 1)__
-
-    In search 1 of the SUBHALO PIPELINE we fit a lens model where:
-
-     - The lens galaxy mass is modeled using MASS PIPELINE's mass distribution [Priors initialized from MASS PIPELINE].
-     - The source galaxy's light is parametric or an inversion depending on the previous MASS PIPELINE [Model and 
-     priors initialized from MASS PIPELINE].
-
-    This search aims to accurately estimate the lens mass model, using the improved mass model priors and source model 
-    of the MASS PIPELINE. This model will be used to perform Bayesian model comparison with models that include a 
-    subhalo, to determine if a subhalo is detected.
-    """
-
-    source = slam_util.source__from_result_model_if_parametric(
-        result=mass_results.last, setup_hyper=setup_hyper
-    )
-
-    model = af.Collection(
-        galaxies=af.Collection(
-            lens=mass_results.last.model.galaxies.lens, source=source
-        ),
-        hyper_image_sky=setup_hyper.hyper_image_sky_from_result(
-            result=mass_results.last, as_model=True
-        ),
-        hyper_background_noise=setup_hyper.hyper_background_noise_from_result(
-            result=mass_results.last
-        ),
-    )
-
-    search = af.DynestyStatic(
-        path_prefix=path_prefix,
-        name="subhalo[1]_mass[total_refine]",
-        unique_tag=unique_tag,
-        session=session,
-        nlive=100,
-    )
-
-    result_1 = search.fit(model=model, analysis=analysis)
-
-    """
-    __Model + Search + Analysis + Model-Fit (Search 2)__
-
-    In search 2 of the SUBHALO PIPELINE we perform a [number_of_steps x number_of_steps] grid search of non-linear
-    searches where:
-
-     - The lens galaxy mass is modeled using MASS PIPELINE's mass distribution [Priors initialized from MASS PIPELINE].
-     - The source galaxy's light is parametric or an inversion depending on the previous MASS PIPELINE [Model and 
-     priors initialized from MASS PIPELINE].
-     - The subhalo redshift is fixed to that of the lens galaxy.
-     - Each grid search varies the subhalo (y,x) coordinates and mass as free parameters.
-     - The priors on these (y,x) coordinates are UniformPriors, with limits corresponding to the grid-cells.
-
-    This search aims to detect a dark matter subhalo.
-    """
-
-    subhalo = af.Model(
-        al.Galaxy, redshift=result_1.instance.galaxies.lens.redshift, mass=subhalo_mass
-    )
-
-    subhalo.mass.mass_at_200 = af.LogUniformPrior(lower_limit=1.0e6, upper_limit=1.0e11)
-    subhalo.mass.centre_0 = af.UniformPrior(
-        lower_limit=-grid_dimension_arcsec, upper_limit=grid_dimension_arcsec
-    )
-    subhalo.mass.centre_1 = af.UniformPrior(
-        lower_limit=-grid_dimension_arcsec, upper_limit=grid_dimension_arcsec
-    )
-
-    subhalo.mass.redshift_object = result_1.instance.galaxies.lens.redshift
-    subhalo.mass.redshift_source = result_1.instance.galaxies.source.redshift
-
-    source = slam_util.source__from_result_model_if_parametric(
-        result=mass_results.last, setup_hyper=setup_hyper
-    )
-
-    model = af.Collection(
-        galaxies=af.Collection(
-            lens=mass_results.last.model.galaxies.lens, subhalo=subhalo, source=source
-        ),
-        hyper_image_sky=setup_hyper.hyper_image_sky_from_result(
-            result=mass_results.last, as_model=True
-        ),
-        hyper_background_noise=setup_hyper.hyper_background_noise_from_result(
-            result=mass_results.last
-        ),
-    )
-
-    search = af.DynestyStatic(
+    return _detection(
         path_prefix=path_prefix,
-        name="subhalo[2]_mass[total]_source_subhalo[search_lens_plane]",
-        unique_tag=unique_tag,
-        session=session,
-        nlive=50,
-        walks=5,
-        facc=0.2,
-    )
-
-    subhalo_grid_search = af.SearchGridSearch(
-        search=search, number_of_steps=number_of_steps, number_of_cores=number_of_cores
-    )
-
-    grid_search_result = subhalo_grid_search.fit(
-        model=model,
         analysis=analysis,
-        grid_priors=[
-            model.galaxies.subhalo.mass.centre_0,
-            model.galaxies.subhalo.mass.centre_1,
-        ],
-    )
-
-    """
-    __Model + Search + Analysis + Model-Fit (Search 3)__
-
-    In search 3 of the SUBHALO PIPELINE we refit the lens and source models above but now including a subhalo, where 
-    the subhalo model is initalized from the highest evidence model of the subhalo grid search.
-
-     - The lens galaxy mass is modeled using MASS PIPELINE's mass distribution [Priors initialized from MASS PIPELINE].
-     - The source galaxy's light is parametric or an inversion depending on the previous MASS PIPELINE [Model and 
-     priors initialized from MASS PIPELINE].
-     - The subhalo redshift is fixed to that of the lens galaxy.
-     - Each grid search varies the subhalo (y,x) coordinates and mass as free parameters.
-     - The priors on these (y,x) coordinates are UniformPriors, with limits corresponding to the grid-cells.
-
-    This search aims to refine the parameter estimates and errors of a dark matter subhalo detected in the grid search
-    above.
-    """
-
-    subhalo = af.Model(
-        al.Galaxy, redshift=result_1.instance.galaxies.lens.redshift, mass=subhalo_mass
-    )
-
-    subhalo.mass.mass_at_200 = (
-        grid_search_result.model.galaxies.subhalo.mass.mass_at_200
-    )
-    subhalo.mass.centre = grid_search_result.model.galaxies.subhalo.mass.centre
-
-    subhalo.mass.redshift_object = grid_search_result.instance.galaxies.lens.redshift
-    subhalo.mass.redshift_source = grid_search_result.instance.galaxies.source.redshift
-
-    model = af.Collection(
-        galaxies=af.Collection(
-            lens=grid_search_result.model.galaxies.lens,
-            subhalo=subhalo,
-            source=grid_search_result.model.galaxies.source,
-        ),
-        hyper_image_sky=grid_search_result.instance.hyper_image_sky,
-        hyper_background_noise=grid_search_result.instance.hyper_background_noise,
-    )
-
-    search = af.DynestyStatic(
-        name="subhalo[3]_subhalo[single_plane_refine]",
+        setup_hyper=setup_hyper,
+        mass_results=mass_results,
+        subhalo_mass=subhalo_mass,
+        grid_dimension_arcsec=grid_dimension_arcsec,
+        number_of_steps=number_of_steps,
+        number_of_cores=number_of_cores,
+        search_2_cls=search_2_cls,
+        search_2_dict=search_2_dict,
+        evidence_threshold=evidence_threshold,
+        multi_plane=False,
         unique_tag=unique_tag,
         session=session,
-        path_prefix=path_prefix,
-        nlive=100,
     )
 
-    result_3 = search.fit(model=model, analysis=analysis)
-
-    return af.ResultsCollection([result_1, grid_search_result, result_3])
-
 
 def detection_multi_plane(
     path_prefix: str,
@@ -217,8 +92,11 @@ def detection_multi_plane(
     mass_results: af.ResultsCollection,
     subhalo_mass: af.Model(al.mp.MassProfile) = af.Model(al.mp.SphNFWMCRLudlow),
     grid_dimension_arcsec: float = 3.0,
-    number_of_steps: Union[Tuple[int], int] = 5,
+    number_of_steps: int = 5,
     number_of_cores: int = 1,
+    search_2_cls: Optional[af.NonLinearSearch] = None,
+    search_2_dict: Optional[dict] = None,
+    evidence_threshold: Optional[float] = None,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ) -> af.ResultsCollection:
@@ -243,14 +121,77 @@ def detection_multi_plane(
         all four directions extends to 3.0" giving it dimensions 6.0" x 6.0".
     number_of_steps
         The 2D dimensions of the grid (e.g. number_of_steps x number_of_steps) that the subhalo search is performed for.
+        The `SearchGridSearch` uses the same number of steps in the y and x directions, therefore this is an int.
     number_of_cores
         The number of cores used to perform the non-linear search grid search. If 1, each model-fit on the grid is
         performed in serial, if > 1 fits are distributed in parallel using the Python multiprocessing module.
+    search_2_cls
+        The non-linear search used by every model-fit of the search 2 grid search. By default this is
+        `DynestyStatic`, whose Bayesian evidences are compared to search 1 to determine if a subhalo is detected.
+        Another nested sampler like `UltraNest` can be used instead, which can be faster for the tightly bounded
+        priors of each grid cell. `DynestyDynamic` can also be used, but its additional live points target the
+        posterior and not the evidence.
+    search_2_dict
+        The dictionary of search options for every model-fit of the search 2 grid search, which by default are the
+        `DynestyStatic` settings. The default options are only used if `search_2_cls` is not input, otherwise the
+        search uses the settings in its config file.
+    evidence_threshold
+        If input, search 3 is only performed if the highest log evidence of the search 2 grid search exceeds the log
+        evidence of search 1 by this amount, such that the subhalo refinement is skipped for datasets where no subhalo
+        is detected. In this case the returned results only contain the results of search 1 and 2.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
     """
 
+    return _detection(
+        path_prefix=path_prefix,
+        analysis=analysis,
+        setup_hyper=setup_hyper,
+        mass_results=mass_results,
+        subhalo_mass=subhalo_mass,
+        grid_dimension_arcsec=grid_dimension_arcsec,
+        number_of_steps=number_of_steps,
+        number_of_cores=number_of_cores,
+        search_2_cls=search_2_cls,
+        search_2_dict=search_2_dict,
+        evidence_threshold=evidence_threshold,
+        multi_plane=True,
+        unique_tag=unique_tag,
+        session=session,
+    )
+
+
+def _detection(
+    path_prefix: str,
+    analysis: Union[al.AnalysisImaging, al.AnalysisInterferometer],
+    setup_hyper: al.SetupHyper,
+    mass_results: af.ResultsCollection,
+    subhalo_mass: af.Model(al.mp.MassProfile),
+    grid_dimension_arcsec: float,
+    number_of_steps: int,
+    number_of_cores: int,
+    search_2_cls: Optional[af.NonLinearSearch],
+    search_2_dict: Optional[dict],
+    evidence_threshold: Optional[float],
+    multi_plane: bool,
+    unique_tag: Optional[str],
+    session: Optional[bool],
+) -> af.ResultsCollection:
+    """
+    Performs the searches of the SLaM SUBHALO PIPELINE for detecting a subhalo, which are used by both
+    `detection_single_plane` and `detection_multi_plane`. The `multi_plane` flag sets which of the two is performed.
+
+    If `multi_plane=False`, the source redshift used by the subhalo mass profile is fixed to that of the source
+    galaxy, such that the subhalo is in the lens plane.
+
+    If `multi_plane=True`, the source redshift used by the subhalo mass profile is a free parameter between 0.0 and
+    the source galaxy redshift in searches 2 and 3, such that the fit includes multi-plane ray-tracing.
+
+    The `multi_plane` flag also sets the names of searches 2 and 3, so that the results of the two pipelines are
+    output to different folders. All other parameters are as described in `detection_single_plane`.
+    """
+
     """
     __Model + Search + Analysis + Model-Fit (Search 1)__
 
@@ -265,20 +206,27 @@ def detection_multi_plane(
     subhalo, to determine if a subhalo is detected.
     """
 
+    mass_result = mass_results.last
+
+    """
+    The source and hyper components are set up once from the MASS PIPELINE result and used by the models of both
+    search 1 and search 2.
+    """
     source = slam_util.source__from_result_model_if_parametric(
-        result=mass_results.last, setup_hyper=setup_hyper
+        result=mass_result, setup_hyper=setup_hyper
+    )
+
+    hyper_image_sky = setup_hyper.hyper_image_sky_from_result(
+        result=mass_result, as_model=True
+    )
+    hyper_background_noise = setup_hyper.hyper_background_noise_from_result(
+        result=mass_result
     )
 
     model = af.Collection(
-        galaxies=af.Collection(
-            lens=mass_results.last.model.galaxies.lens, source=source
-        ),
-        hyper_image_sky=setup_hyper.hyper_image_sky_from_result(
-            result=mass_results.last, as_model=True
-        ),
-        hyper_background_noise=setup_hyper.hyper_background_noise_from_result(
-            result=mass_results.last
-        ),
+        galaxies=af.Collection(lens=mass_result.model.galaxies.lens, source=source),
+        hyper_image_sky=hyper_image_sky,
+        hyper_background_noise=hyper_background_noise,
     )
 
     search = af.DynestyStatic(
@@ -291,6 +239,16 @@ def detection_multi_plane(
 
     result_1 = search.fit(model=model, analysis=analysis)
 
+    redshift_lens = result_1.instance.galaxies.lens.redshift
+    redshift_source = result_1.instance.galaxies.source.redshift
+
+    if multi_plane:
+        search_2_tag = "multi_plane"
+        search_3_tag = "multi_plane_refine"
+    else:
+        search_2_tag = "search_lens_plane"
+        search_3_tag = "single_plane_refine"
+
     """
     __Model + Search + Analysis + Model-Fit (Search 2)__
 
@@ -301,14 +259,19 @@ def detection_multi_plane(
      - The source galaxy's light is parametric or an inversion depending on the previous MASS PIPELINE [Model and 
      priors initialized from MASS PIPELINE].
      - The subhalo redshift is fixed to that of the lens galaxy.
+     - If `multi_plane=True`, the source redshift used by the subhalo mass profile is a free parameter.
      - Each grid search varies the subhalo (y,x) coordinates and mass as free parameters.
      - The priors on these (y,x) coordinates are UniformPriors, with limits corresponding to the grid-cells.
 
     This search aims to detect a dark matter subhalo.
     """
 
+    """
+    The default `subhalo_mass` model is created once when the pipeline is defined and shared by every call, therefore
+    it is copied before its priors are customized below so that they do not persist into search 3 or later calls.
+    """
     subhalo = af.Model(
-        al.Galaxy, redshift=result_1.instance.galaxies.lens.redshift, mass=subhalo_mass
+        al.Galaxy, redshift=redshift_lens, mass=copy.deepcopy(subhalo_mass)
     )
 
     subhalo.mass.mass_at_200 = af.LogUniformPrior(lower_limit=1.0e6, upper_limit=1.0e11)
@@ -319,35 +282,36 @@ def detection_multi_plane(
         lower_limit=-grid_dimension_arcsec, upper_limit=grid_dimension_arcsec
     )
 
-    subhalo.mass.redshift_object = result_1.instance.galaxies.lens.redshift
-    subhalo.mass.redshift_source = af.UniformPrior(
-        lower_limit=0.0, upper_limit=result_1.instance.galaxies.source.redshift
-    )
+    subhalo.mass.redshift_object = redshift_lens
 
-    source = slam_util.source__from_result_model_if_parametric(
-        result=mass_results.last, setup_hyper=setup_hyper
-    )
+    if multi_plane:
+        subhalo.mass.redshift_source = af.UniformPrior(
+            lower_limit=0.0, upper_limit=redshift_source
+        )
+    else:
+        subhalo.mass.redshift_source = redshift_source
 
     model = af.Collection(
         galaxies=af.Collection(
-            lens=mass_results.last.model.galaxies.lens, subhalo=subhalo, source=source
-        ),
-        hyper_image_sky=setup_hyper.hyper_image_sky_from_result(
-            result=mass_results.last, as_model=True
-        ),
-        hyper_background_noise=setup_hyper.hyper_background_noise_from_result(
-            result=mass_results.last
+            lens=mass_result.model.galaxies.lens, subhalo=subhalo, source=source
         ),
+        hyper_image_sky=hyper_image_sky,
+        hyper_background_noise=hyper_background_noise,
     )
 
-    search = af.DynestyStatic(
+    search_2_cls, search_2_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_2_cls,
+        search_dict=search_2_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 50, "walks": 5, "facc": 0.2},
+    )
+
+    search = search_2_cls(
         path_prefix=path_prefix,
-        name="subhalo[2]_mass[total]_source_subhalo[multi_plane]",
+        name=f"subhalo[2]_mass[total]_source_subhalo[{search_2_tag}]",
         unique_tag=unique_tag,
         session=session,
-        nlive=50,
-        walks=5,
-        facc=0.2,
+        **search_2_dict,
     )
 
     subhalo_grid_search = af.SearchGridSearch(
@@ -363,6 +327,16 @@ def detection_multi_plane(
         ],
     )
 
+    if evidence_threshold is not None:
+
+        log_evidence_increase = (
+            np.max(grid_search_result.log_evidences_native)
+            - result_1.samples.log_evidence
+        )
+
+        if log_evidence_increase < evidence_threshold:
+            return af.ResultsCollection([result_1, grid_search_result])
+
     """
     __Model + Search + Analysis + Model-Fit (Search 3)__
 
@@ -373,6 +347,7 @@ def detection_multi_plane(
      - The source galaxy's light is parametric or an inversion depending on the previous MASS PIPELINE [Model and 
      priors initialized from MASS PIPELINE].
      - The subhalo redshift is fixed to that of the lens galaxy.
+     - If `multi_plane=True`, the source redshift used by the subhalo mass profile is a free parameter.
      - Each grid search varies the subhalo (y,x) coordinates and mass as free parameters.
      - The priors on these (y,x) coordinates are UniformPriors, with limits corresponding to the grid-cells.
 
@@ -381,7 +356,7 @@ def detection_multi_plane(
     """
 
     subhalo = af.Model(
-        al.Galaxy, redshift=result_1.instance.galaxies.lens.redshift, mass=subhalo_mass
+        al.Galaxy, redshift=redshift_lens, mass=copy.deepcopy(subhalo_mass)
     )
 
     subhalo.mass.mass_at_200 = (
@@ -389,10 +364,14 @@ def detection_multi_plane(
     )
     subhalo.mass.centre = grid_search_result.model.galaxies.subhalo.mass.centre
 
-    subhalo.mass.redshift_object = grid_search_result.instance.galaxies.lens.redshift
-    subhalo.mass.redshift_source = af.UniformPrior(
-        lower_limit=0.0, upper_limit=result_1.instance.galaxies.source.redshift
-    )
+    subhalo.mass.redshift_object = redshift_lens
+
+    if multi_plane:
+        subhalo.mass.redshift_source = af.UniformPrior(
+            lower_limit=0.0, upper_limit=redshift_source
+        )
+    else:
+        subhalo.mass.redshift_source = redshift_source
 
     model = af.Collection(
         galaxies=af.Collection(
@@ -405,7 +384,7 @@ def detection_multi_plane(
     )
 
     search = af.DynestyStatic(
-        name="subhalo[3]_subhalo[multi_plane_refine]",
+        name=f"subhalo[3]_subhalo[{search_3_tag}]",
         unique_tag=unique_tag,
         session=session,
         path_prefix=path_prefix,
@@ -427,6 +406,14 @@ def sensitivity_mapping_imaging(
     grid_dimension_arcsec: float = 3.0,
     number_of_steps: Union[Tuple[int], int] = 5,
     number_of_cores: int = 1,
+    search_cls: Optional[af.NonLinearSearch] = None,
+    search_dict: Optional[dict] = None,
+    sub_size: Optional[int] = None,
+    fractional_accuracy: float = 0.9999,
+    sub_steps: Optional[List[int]] = None,
+    exposure_time: float = 300.0,
+    background_sky_level: float = 0.1,
+    add_poisson_noise: bool = True,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ):
@@ -454,10 +441,40 @@ def sensitivity_mapping_imaging(
         the arc-second dimensions of the grid in the y and x directions. An input value of 3.0" means the grid in
         all four directions extends to 3.0" giving it dimensions 6.0" x 6.0".
     number_of_steps
-        The 2D dimensions of the grid (e.g. number_of_steps x number_of_steps) that the subhalo search is performed for.
+        The number of steps every parameter of the `perturbation_model` is iterated over. A tuple can be input to use
+        a different number of steps for each parameter, in the order (mass_at_200, centre_0, centre_1), for example
+        to use fewer steps in the direction perpendicular to an elongated Einstein ring.
     number_of_cores
         The number of cores used to perform the non-linear search grid search. If 1, each model-fit on the grid is
         performed in serial, if > 1 fits are distributed in parallel using the Python multiprocessing module.
+    search_cls
+        The non-linear search used to fit every simulated dataset. By default this is `DynestyStatic`, as sensitivity
+        mapping compares the Bayesian evidences of the fits with and without a subhalo, but another nested sampler like
+        `UltraNest` can be used instead.
+    search_dict
+        The dictionary of search options for the non-linear search used to fit every simulated dataset, which by
+        default are the `DynestyStatic` settings. The default options are only used if `search_cls` is not input,
+        otherwise the search uses the settings in its config file.
+    sub_size
+        If input, every dataset is simulated using a `Grid2D` with this fixed sub-grid size, as opposed to a
+        `Grid2DIterate` which adapts the sub-grid size of every pixel until the image reaches a fractional accuracy of
+        0.9999. This is significantly faster, and a suitable value can be found by simulating one dataset with a
+        `Grid2DIterate` and fixed sub-grid sizes of 4, 8 and 16 and choosing the smallest whose image matches the
+        `Grid2DIterate` image to within the noise.
+    fractional_accuracy
+        If a `Grid2DIterate` is used to simulate every dataset, the fractional accuracy the image of every pixel must
+        reach before its sub-grid size stops being increased. Sensitivity mapping only compares the Bayesian evidence
+        of fits to noisy data, therefore a lower accuracy (e.g. 0.999) is often sufficient and faster.
+    sub_steps
+        If a `Grid2DIterate` is used to simulate every dataset, the sub-grid sizes it iterates over, which by default
+        are [2, 4, 8, 16, 24].
+    exposure_time
+        The exposure time of every simulated dataset, which sets its S/N. A short exposure time can be used for a
+        quick pilot sensitivity map that locates where subhalos are detectable, before the full sensitivity map.
+    background_sky_level
+        The background sky level of every simulated dataset.
+    add_poisson_noise
+        Whether Poisson noise is added to every simulated dataset.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -478,7 +495,9 @@ def sensitivity_mapping_imaging(
     mass pipeline. This ensures the priors associated with each parameter are initialized so as to speed up
     each non-linear search performed during sensitivity mapping.
     """
-    base_model = mass_results.last.model
+    mass_result = mass_results.last
+
+    base_model = mass_result.model
 
     """
     We now define the `perturbation_model`, which is the model component whose parameters we iterate over to perform 
@@ -496,7 +515,9 @@ def sensitivity_mapping_imaging(
     subhalo the model-fit including a subhalo provide higher values of Bayesian evidence than the simpler model-fit (and
     therefore when it is detectable!).
     """
-    perturbation_model = af.Model(al.Galaxy, redshift=0.5, mass=subhalo_mass)
+    perturbation_model = af.Model(
+        al.Galaxy, redshift=0.5, mass=copy.deepcopy(subhalo_mass)
+    )
 
     """
     Sensitivity mapping is typically performed over a large range of parameters. However, to make this demonstration quick
@@ -513,12 +534,8 @@ def sensitivity_mapping_imaging(
     perturbation_model.mass.centre.centre_1 = af.UniformPrior(
         lower_limit=-grid_dimension_arcsec, upper_limit=grid_dimension_arcsec
     )
-    perturbation_model.mass.redshift_object = (
-        mass_results.last.model.galaxies.lens.redshift
-    )
-    perturbation_model.mass.redshift_source = (
-        mass_results.last.model.galaxies.source.redshift
-    )
+    perturbation_model.mass.redshift_object = mass_result.model.galaxies.lens.redshift
+    perturbation_model.mass.redshift_source = mass_result.model.galaxies.source.redshift
 
     """
     We are performing sensitivity mapping to determine when a subhalo is detectable. Eery simulated dataset must 
@@ -527,7 +544,35 @@ def sensitivity_mapping_imaging(
 
     This includes the lens light and mass and source galaxy light.
     """
-    simulation_instance = mass_results.last.instance
+    simulation_instance = mass_result.instance
+
+    """
+    Set up the grid, PSF and simulator settings used to simulate imaging of the strong lens. These should be tuned to
+    match the S/N and noise properties of the observed data you are performing sensitivity mapping on.
+
+    These are the same for every simulated dataset, therefore they are set up once here and used by every call of the
+    `simulate_function` below.
+    """
+    if sub_size is not None:
+        grid = al.Grid2D.uniform(
+            shape_native=mask.shape_native,
+            pixel_scales=mask.pixel_scales,
+            sub_size=sub_size,
+        )
+    else:
+        grid = al.Grid2DIterate.uniform(
+            shape_native=mask.shape_native,
+            pixel_scales=mask.pixel_scales,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps or [2, 4, 8, 16, 24],
+        )
+
+    simulator = al.SimulatorImaging(
+        exposure_time=exposure_time,
+        psf=psf,
+        background_sky_level=background_sky_level,
+        add_poisson_noise=add_poisson_noise,
+    )
 
     """
     We now write the `simulate_function`, which takes the `simulation_instance` of our model (defined above) and uses it to 
@@ -554,24 +599,6 @@ def sensitivity_mapping_imaging(
             ]
         )
 
-        """
-        Set up the grid, PSF and simulator settings used to simulate imaging of the strong lens. These should be tuned to
-        match the S/N and noise properties of the observed data you are performing sensitivity mapping on.
-        """
-        grid = al.Grid2DIterate.uniform(
-            shape_native=mask.shape_native,
-            pixel_scales=mask.pixel_scales,
-            fractional_accuracy=0.9999,
-            sub_steps=[2, 4, 8, 16, 24],
-        )
-
-        simulator = al.SimulatorImaging(
-            exposure_time=300.0,
-            psf=psf,
-            background_sky_level=0.1,
-            add_poisson_noise=True,
-        )
-
         simulated_imaging = simulator.from_tracer_and_grid(tracer=tracer, grid=grid)
 
         """
@@ -583,7 +610,14 @@ def sensitivity_mapping_imaging(
     """
     We next specify the search used to perform each model fit by the sensitivity mapper.
     """
-    search = af.DynestyStatic(path_prefix=path_prefix, nlive=50)
+    search_cls, search_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_cls,
+        search_dict=search_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 50},
+    )
+
+    search = search_cls(path_prefix=path_prefix, **search_dict)
 
     """
     We can now combine all of the objects created above and perform sensitivity mapping. The inputs to the `Sensitivity`
@@ -637,6 +671,14 @@ def sensitivity_mapping_interferometer(
     grid_dimension_arcsec: float = 3.0,
     number_of_steps: Union[Tuple[int], int] = 5,
     number_of_cores: int = 1,
+    search_cls: Optional[af.NonLinearSearch] = None,
+    search_dict: Optional[dict] = None,
+    sub_size: Optional[int] = None,
+    fractional_accuracy: float = 0.9999,
+    sub_steps: Optional[List[int]] = None,
+    exposure_time: float = 300.0,
+    background_sky_level: float = 0.1,
+    noise_sigma: float = 0.1,
     unique_tag: Optional[str] = None,
     session: Optional[bool] = None,
 ):
@@ -663,10 +705,40 @@ def sensitivity_mapping_interferometer(
         the arc-second dimensions of the grid in the y and x directions. An input value of 3.0" means the grid in
         all four directions extends to 3.0" giving it dimensions 6.0" x 6.0".
     number_of_steps
-        The 2D dimensions of the grid (e.g. number_of_steps x number_of_steps) that the subhalo search is performed for.
+        The number of steps every parameter of the `perturbation_model` is iterated over. A tuple can be input to use
+        a different number of steps for each parameter, in the order (mass_at_200, centre_0, centre_1), for example
+        to use fewer steps in the direction perpendicular to an elongated Einstein ring.
     number_of_cores
         The number of cores used to perform the non-linear search grid search. If 1, each model-fit on the grid is
         performed in serial, if > 1 fits are distributed in parallel using the Python multiprocessing module.
+    search_cls
+        The non-linear search used to fit every simulated dataset. By default this is `DynestyStatic`, as sensitivity
+        mapping compares the Bayesian evidences of the fits with and without a subhalo, but another nested sampler like
+        `UltraNest` can be used instead.
+    search_dict
+        The dictionary of search options for the non-linear search used to fit every simulated dataset, which by
+        default are the `DynestyStatic` settings. The default options are only used if `search_cls` is not input,
+        otherwise the search uses the settings in its config file.
+    sub_size
+        If input, every dataset is simulated using a `Grid2D` with this fixed sub-grid size, as opposed to a
+        `Grid2DIterate` which adapts the sub-grid size of every pixel until the image reaches a fractional accuracy of
+        0.9999. This is significantly faster, and a suitable value can be found by simulating one dataset with a
+        `Grid2DIterate` and fixed sub-grid sizes of 4, 8 and 16 and choosing the smallest whose visibilities match the
+        `Grid2DIterate` visibilities to within the noise.
+    fractional_accuracy
+        If a `Grid2DIterate` is used to simulate every dataset, the fractional accuracy the image of every pixel must
+        reach before its sub-grid size stops being increased.
+    sub_steps
+        If a `Grid2DIterate` is used to simulate every dataset, the sub-grid sizes it iterates over, which by default
+        are [2, 4, 8, 16, 24].
+    exposure_time
+        The exposure time of every simulated dataset.
+    background_sky_level
+        The background sky level of every simulated dataset.
+    noise_sigma
+        The sigma of the Gaussian noise added to the visibilities of every simulated dataset, which sets its S/N. A
+        higher value can be used for a quick pilot sensitivity map that locates where subhalos are detectable, before
+        the full sensitivity map.
     unique_tag
         The unique tag for this model-fit, which will be given a unique entry in the sqlite database and also acts as
         the folder after the path prefix and before the search name. This is typically the name of the dataset.
@@ -687,7 +759,9 @@ def sensitivity_mapping_interferometer(
     mass pipeline. This ensures the priors associated with each parameter are initialized so as to speed up
     each non-linear search performed during sensitivity mapping.
     """
-    base_model = mass_results.last.model
+    mass_result = mass_results.last
+
+    base_model = mass_result.model
 
     """
     We now define the `perturbation_model`, which is the model component whose parameters we iterate over to perform 
@@ -705,7 +779,9 @@ def sensitivity_mapping_interferometer(
     subhalo the model-fit including a subhalo provide higher values of Bayesian evidence than the simpler model-fit (and
     therefore when it is detectable!).
     """
-    perturbation_model = af.Model(al.Galaxy, redshift=0.5, mass=subhalo_mass)
+    perturbation_model = af.Model(
+        al.Galaxy, redshift=0.5, mass=copy.deepcopy(subhalo_mass)
+    )
 
     """
     Sensitivity mapping is typically performed over a large range of parameters. However, to make this demonstration quick
@@ -722,12 +798,8 @@ def sensitivity_mapping_interferometer(
     perturbation_model.mass.centre.centre_1 = af.UniformPrior(
         lower_limit=-grid_dimension_arcsec, upper_limit=grid_dimension_arcsec
     )
-    perturbation_model.mass.redshift_object = (
-        mass_results.last.model.galaxies.lens.redshift
-    )
-    perturbation_model.mass.redshift_source = (
-        mass_results.last.model.galaxies.source.redshift
-    )
+    perturbation_model.mass.redshift_object = mass_result.model.galaxies.lens.redshift
+    perturbation_model.mass.redshift_source = mass_result.model.galaxies.source.redshift
 
     """
     We are performing sensitivity mapping to determine when a subhalo is detectable. Eery simulated dataset must 
@@ -736,7 +808,44 @@ def sensitivity_mapping_interferometer(
 
     This includes the lens light and mass and source galaxy light.
     """
-    simulation_instance = mass_results.last.instance
+    simulation_instance = mass_result.instance
+
+    """
+    Set up the grid and simulator settings used to simulate interferometer data of the strong lens. These should be 
+    tuned to match the S/N and noise properties of the observed data you are performing sensitivity mapping on.
+
+    These are the same for every simulated dataset, therefore they are set up once here and used by every call of the
+    `simulate_function` below. This includes the `TransformerNUFFT` the simulator uses to map each image to 
+    visibilities, whose NUFFT plan is expensive to initialize but only depends on the `uv_wavelengths` and grid.
+
+    The `Interferometer` objects created for every simulated dataset (by the simulator and in the `simulate_function`)
+    still set up their own `TransformerNUFFT`, which is not reused.
+    """
+    if sub_size is not None:
+        grid = al.Grid2D.uniform(
+            shape_native=real_space_mask.shape_native,
+            pixel_scales=real_space_mask.pixel_scales,
+            sub_size=sub_size,
+        )
+    else:
+        grid = al.Grid2DIterate.uniform(
+            shape_native=real_space_mask.shape_native,
+            pixel_scales=real_space_mask.pixel_scales,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps or [2, 4, 8, 16, 24],
+        )
+
+    transformer = al.TransformerNUFFT(
+        uv_wavelengths=uv_wavelengths, real_space_mask=grid.mask.mask_sub_1
+    )
+
+    simulator = al.SimulatorInterferometer(
+        uv_wavelengths=uv_wavelengths,
+        exposure_time=exposure_time,
+        background_sky_level=background_sky_level,
+        noise_sigma=noise_sigma,
+        transformer_class=lambda uv_wavelengths, real_space_mask: transformer,
+    )
 
     """
     We now write the `simulate_function`, which takes the `simulation_instance` of our model (defined above) and uses it to 
@@ -763,25 +872,6 @@ def sensitivity_mapping_interferometer(
             ]
         )
 
-        """
-        Set up the grid, PSF and simulator settings used to simulate imaging of the strong lens. These should be tuned to
-        match the S/N and noise properties of the observed data you are performing sensitivity mapping on.
-        """
-        grid = al.Grid2DIterate.uniform(
-            shape_native=real_space_mask.shape_native,
-            pixel_scales=real_space_mask.pixel_scales,
-            fractional_accuracy=0.9999,
-            sub_steps=[2, 4, 8, 16, 24],
-        )
-
-        simulator = al.SimulatorInterferometer(
-            uv_wavelengths=uv_wavelengths,
-            exposure_time=300.0,
-            background_sky_level=0.1,
-            noise_sigma=0.1,
-            transformer_class=al.TransformerNUFFT,
-        )
-
         simulated_interferometer = simulator.from_tracer_and_grid(
             tracer=tracer, grid=grid
         )
@@ -800,7 +890,14 @@ def sensitivity_mapping_interferometer(
     """
     We next specify the search used to perform each model fit by the sensitivity mapper.
     """
-    search = af.DynestyStatic(path_prefix=path_prefix, nlive=50)
+    search_cls, search_dict = slam_util.search_cls_and_dict_from(
+        search_cls=search_cls,
+        search_dict=search_dict,
+        default_search_cls=af.DynestyStatic,
+        default_search_dict={"nlive": 50},
+    )
+
+    search = search_cls(path_prefix=path_prefix, **search_dict)
 
     """
     We can now combine all of the objects created above and perform sensitivity mapping. The inputs to the `Sensitivity`